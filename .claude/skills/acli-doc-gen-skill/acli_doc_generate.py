@@ -4,11 +4,109 @@
 
 import os
 import json
-import copy
 import re
-from typing import List, Dict, Set
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Set, Tuple, Optional, Callable
 from pathlib import Path
 
+try:
+    import msgspec
+    # 解码 commands_json 的同时校验其为字符串数组
+    _COMMANDS_DECODER = msgspec.json.Decoder(List[str])
+except ImportError:
+    _COMMANDS_DECODER = None
+
+# 写入生成文件时使用的标志位；O_BINARY 仅 Windows 存在，保证写入的字节不做换行转换
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+# 写入文件的线程数；文件数少于阈值时直接在当前线程写入，避免创建线程池的开销
+_WRITE_WORKERS = 16
+_PARALLEL_WRITE_THRESHOLD = 32
+
+# _category_.json 模板中待替换字段的哨兵值
+# 以 NUL 字符包裹，避免与用户模板中的真实字段值冲突
+_LABEL_SENTINEL = "\0acli_doc:label\0"
+_ID_SENTINEL = "\0acli_doc:id\0"
+_DESCRIPTION_SENTINEL = "\0acli_doc:description\0"
+# 序列化后的模板中哨兵值所在的位置（带引号，即 JSON 字符串，NUL 被转义为 \u0000）
+_SENTINEL_RE = re.compile(b"(" + b"|".join(
+    re.escape(json.dumps(sentinel).encode('utf-8'))
+    for sentinel in (_LABEL_SENTINEL, _ID_SENTINEL, _DESCRIPTION_SENTINEL)
+) + b")")
+
+
+@functools.lru_cache(maxsize=None)
+def _key_pattern(key: str):
+    """
+    获取匹配 {key} 或 {包含key的文字} 的预编译正则
+    """
+    return re.compile(f"\\{{[^}}]*{re.escape(key)}[^}}]*\\}}")
+
+
+@functools.lru_cache(maxsize=None)
+def _keys_pattern(keys: tuple):
+    """
+    获取一次匹配所有直接的 {key} 占位符的预编译正则
+    """
+    return re.compile("\\{(" + "|".join(re.escape(key) for key in keys) + ")\\}")
+
+
+def _dumps_json(data) -> bytes:
+    """
+    将数据序列化为 UTF-8 字节，格式与 json.dump(data, f, indent=4, ensure_ascii=False) 一致
+    一次生成完整内容后整体写入，避免 json.dump 逐块写入文件
+    """
+    return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+
+
+def _json_str(value: str) -> bytes:
+    """
+    将字符串序列化为 JSON 字符串字面量的 UTF-8 字节
+    """
+    return json.dumps(value, ensure_ascii=False).encode('utf-8')
+
+
+def _compile_json_template(template: Dict) -> Callable[[Dict[str, str]], bytes]:
+    """
+    将含哨兵值的模板序列化一次并在哨兵处切分，返回渲染函数
+    渲染时只需将固定的字节片段与各字段的 JSON 字符串拼接
+    """
+    parts = _SENTINEL_RE.split(_dumps_json(template))
+    # 切分结果中奇数位置为哨兵值
+    names = [json.loads(part) for part in parts[1::2]]
+    
+    def render(values: Dict[str, str]) -> bytes:
+        pieces = parts[:]
+        pieces[1::2] = [_json_str(values[name]) for name in names]
+        return b"".join(pieces)
+    
+    return render
+
+
+def _replace_title(content: str, command: str) -> str:
+    """
+    替换标题占位符 # {...} 为 # command
+    与原先的正则替换等价：占位符不跨行，替换全部出现的位置
+    """
+    pieces = []
+    pos = 0
+    start = content.find("# {")
+    while start != -1:
+        end = content.find("}", start + 3)
+        if end == -1:
+            break
+        if content.find("\n", start, end) != -1:
+            # 占位符跨行，不是标题占位符
+            start = content.find("# {", start + 1)
+            continue
+        pieces.append(content[pos:start])
+        pieces.append(f"# {command}")
+        pos = end + 1
+        start = content.find("# {", pos)
+    pieces.append(content[pos:])
+    return "".join(pieces)
+
+
 class DocTemplateGenerator:
     """
     根据 命令结构 和 当前目录的文档树 生成 Docusaurus 模板文件
@@ -20,40 +118,109 @@ class DocTemplateGenerator:
         self._template_cache = {}  # 模板内容缓存
         self._generated_files = []  # 记录新生成的文件（只包含文件内容）
         self._new_directories = set()  # 记录新生成的目录
+        self._existing_labels = set()  # 已存在的 _category_.json 中的 label 索引
+        self._created_dirs = set()  # 本次运行中已确认存在的目录
+        self._output_dir_empty = False  # 输出目录在生成前是否为空（或不存在）
+        self._generated_paths = set()  # 本次运行中生成的文件的完整路径（包括尚未写入的）
+        self._generated_total_size = 0  # 已写入文件的总字节数
+        # 逐个文件的输出较多，只有设置了环境变量 ACLI_DOC_VERBOSE 时才打印
+        # 取值为空、0、false、no、off（不区分大小写）时视为关闭
+        self._verbose = os.environ.get("ACLI_DOC_VERBOSE", "").strip().lower() not in ("", "0", "false", "no", "off")
         
         print(f"文档生成器初始化:")
         print(f"  输出目录: {output_dir}")
         print(f"  模板目录: {template_dir}")
+        
+        self._preload_templates()
+        self._make_category_renderers()
     
-    def _load_template(self, template_name: str):
+    def _preload_templates(self):
         """
-        加载模板文件内容
+        预先加载模板目录下的全部模板，每个模板文件只读取和解析一次
+        .json 模板缓存解析后的对象，.md 模板缓存文本内容
         """
-        if template_name in self._template_cache:
-            return self._template_cache[template_name]
+        try:
+            with os.scandir(self.template_dir) as it:
+                entries = sorted((entry for entry in it if entry.is_file()), key=lambda e: e.name)
+        except OSError:
+            print(f"  ✗ 模板目录不存在: {self.template_dir}，将使用默认模板")
+            return
         
-        template_path = os.path.join(self.template_dir, template_name)
-        print(f"  尝试加载模板: {template_path}")
+        for entry in entries:
+            try:
+                if entry.name.endswith('.json'):
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        self._template_cache[entry.name] = json.load(f)
+                    print(f"  ✓ 成功加载 JSON 模板: {entry.name}")
+                elif entry.name.endswith('.md'):
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        self._template_cache[entry.name] = f.read()
+                    print(f"  ✓ 成功加载 Markdown 模板: {entry.name}")
+            except Exception as e:
+                print(f"  ✗ 加载模板失败: {entry.path}: {e}")
+    
+    def _log(self, message: str):
+        """
+        打印逐个文件的详细信息，仅在详细模式下输出
+        """
+        if self._verbose:
+            print(message)
+    
+    def _load_template(self, template_name: str):
+        """
+        获取预加载的模板内容，模板不存在时返回 None
+        """
+        return self._template_cache.get(template_name)
+    
+    def _make_category_renderers(self):
+        """
+        预先绑定 _category_.json 的渲染函数
+        模板（不存在时使用默认模板）只序列化一次，每个目录只需拼接字节
+        """
+        # 普通版本（模板1）
+        template = self._load_template("_category_.json")
+        if template is not None and not isinstance(template, dict):
+            print("  ✗ 模板格式错误: _category_.json，将使用默认模板")
+            template = None
+        if template is None:
+            # 使用默认模板
+            template = {
+                "label": _LABEL_SENTINEL,
+                "position": 1,
+                "link": {
+                    "type": "generated-index",
+                    "description": _DESCRIPTION_SENTINEL
+                }
+            }
+        else:
+            # 浅复制模板并将 "label" 字段设置为哨兵值
+            template = {**template, "label": _LABEL_SENTINEL}
+            # TODO: 后续考虑替换对应字段
+        self._render_category_json = _compile_json_template(template)
         
-        try:
-            if template_name.endswith('.json'):
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    content = json.load(f)
-                    self._template_cache[template_name] = content
-                    print(f"  ✓ 成功加载 JSON 模板: {template_name}")
-                    return content
-            else:
-                with open(template_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    self._template_cache[template_name] = content
-                    print(f"  ✓ 成功加载 Markdown 模板: {template_name}")
-                    return content
-        except FileNotFoundError:
-            print(f"  ✗ 模板文件不存在: {template_path}")
-            return None
-        except Exception as e:
-            print(f"  ✗ 加载模板失败: {e}")
-            return None
+        # 冲突版本（模板2）
+        template = self._load_template("_category_conflict.json")
+        if template is not None and not (isinstance(template, dict) and isinstance(template.get("link", {}), dict)):
+            print("  ✗ 模板格式错误: _category_conflict.json，将使用默认模板")
+            template = None
+        if template is None:
+            # 使用默认模板
+            template = {
+                "label": _LABEL_SENTINEL,
+                "position": 1,
+                "link": {
+                    "type": "doc",
+                    "id": _ID_SENTINEL
+                }
+            }
+        else:
+            # 浅复制模板并将 "label"、"id" 字段设置为哨兵值，只复制被修改的层级
+            template = {
+                **template,
+                "label": _LABEL_SENTINEL,
+                "link": {**template.get("link", {}), "id": _ID_SENTINEL}
+            }
+        self._render_category_conflict = _compile_json_template(template)
     
     def _replace_placeholders(self, content: str, **kwargs) -> str:
         """
@@ -62,130 +229,120 @@ class DocTemplateGenerator:
         1. {占位符文字} - 根据文字匹配并替换
         2. {} - 空占位符，用默认值（如果有的话）替换
         """
+        values = {key: str(value) for key, value in kwargs.items()}
+        
         # 先处理有文字的占位符
-        for key, value in kwargs.items():
-            # 匹配 {key} 或 {包含key的文字}
-            patterns = [
-                f"{{{key}}}",  # 直接的 {key}
-                f"{{.*{key}.*}}"  # 包含 key 的描述，如 {和文件名同名的命令，如：get.md 这里就是 get}
-            ]
-            for pattern in patterns:
-                content = re.sub(pattern, str(value), content)
+        # 直接的 {key}，所有 key 一次扫描完成替换
+        if values:
+            content = _keys_pattern(tuple(values)).sub(lambda m: values[m.group(1)], content)
+        # 包含 key 的描述，如 {和文件名同名的命令，如：get.md 这里就是 get}
+        # 仅在仍有占位符时才使用正则
+        for key, text in values.items():
+            if '{' not in content:
+                break
+            content = _key_pattern(key).sub(lambda _, text=text: text, content)
         
         # 处理空的 {} 占位符
         # 如果提供了 default_value 参数，替换所有 {}
         if 'default_value' in kwargs:
-            content = re.sub(r"{}", str(kwargs['default_value']), content)
+            content = content.replace("{}", str(kwargs['default_value']))
         
         return content
     
+    def _ensure_dir(self, dir_path: str):
+        """
+        确保目录存在，同一目录只调用一次 os.makedirs
+        """
+        if dir_path not in self._created_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._created_dirs.add(dir_path)
+    
     def _file_exists(self, file_path: str) -> bool:
         """
         检查文件是否已存在
         """
-        return os.path.exists(file_path)
+        return os.path.lexists(file_path)
     
-    def _check_label_conflict(self, label: str) -> bool:
+    def _scan_existing_labels(self) -> Set[str]:
         """
-        检查 label 是否与现有的 _category_.json 文件冲突
-        通过搜索 "label".*"目录名" 来查找冲突
+        扫描输出目录中所有的 _category_.json，收集其中的 label
+        只需遍历一次文档树，后续冲突检查直接查询该集合
         """
+        labels = set()
         # 使用 Path. rglob 替代 os.walk，更简洁高效
         output_path = Path(self.output_dir)
         
         for category_file in output_path.rglob("_category_.json"):
             try:
-                # 直接解析 JSON 而不是正则匹配文本
-                with category_file.open('r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # 直接访问 label 字段
-                    if data.get('label') == label:
-                        return True
-            except (json.JSONDecodeError, OSError, KeyError):
-                # 统一异常处理，降低圈复杂度
+                # 直接解析 JSON 而不是正则匹配文本，只认顶层的 label 字段
+                data = json.loads(category_file.read_bytes())
+                label = data.get('label')
+                # 只收集字符串 label；列表等不可哈希的值无法放入集合，也不可能与目录名冲突
+                if isinstance(label, str):
+                    labels.add(label)
+            except (ValueError, OSError, AttributeError):
+                # 统一异常处理（JSON 与编码错误均为 ValueError），降低圈复杂度
                 continue
         
-        return False
+        return labels
+    
+    def _check_label_conflict(self, label: str) -> bool:
+        """
+        检查 label 是否与现有的 _category_.json 文件冲突
+        """
+        return label in self._existing_labels
     
-    def _generate_category_json(self, dir_path: str, label: str):
+    def _generate_category_json(self, dir_path: str, label: str) -> Tuple[str, bytes]:
         """
         生成普通的 _category_.json 文件（模板1）
+        返回 (文件路径, 文件内容)，由 _write_files 统一写入
         """
         category_file = os.path.join(dir_path, "_category_.json")
         
-        # 加载模板
-        template = self._load_template("_category_.json")
-        
-        if template is None:
-            # 使用默认模板
-            template = {
-                "label": label,
-                "position": 1,
-                "link": {
-                    "type": "generated-index",
-                    "description": f"{label} 相关文档"
-                }
-            }
-        else:
-            # 复制模板并替换占位符
-            template = copy.deepcopy(template)
-            # 替换 "label" 字段
-            template["label"] = label
-            # TODO: 后续考虑替换对应字段
+        # 使用预先绑定的模板渲染函数
+        data = self._render_category_json({
+            _LABEL_SENTINEL: label,
+            _DESCRIPTION_SENTINEL: f"{label} 相关文档"
+        })
         
-        # 写入文件
-        with open(category_file, 'w', encoding='utf-8') as f:
-            json.dump(template, f, indent=4, ensure_ascii=False)
+        self._existing_labels.add(label)
         
-        # 记录新生成的文件（只记录路径，不记录内容）
+        # 记录本次运行生成的文件，用于去重；写入成功后才计入摘要
+        self._generated_paths.add(category_file)
         rel_path = os.path.relpath(category_file, self.output_dir)
-        self._generated_files.append(rel_path)
         
-        print(f"  ✓ 生成 {rel_path}")
+        self._log(f"  ✓ 生成 {rel_path}")
+        
+        return category_file, data
     
-    def _generate_category_conflict(self, dir_path: str, label: str, full_path: str):
+    def _generate_category_conflict(self, dir_path: str, label: str, full_path: str) -> Tuple[str, bytes]:
         """
-        生成冲突版本的 _category_.json 和对应的 category.md
+        生成冲突版本的 _category_.json（链接到对应的 category.md）
+        返回 (文件路径, 文件内容)，由 _write_files 统一写入
         """
         # 生成 _category_.json（模板2）
         category_file = os.path.join(dir_path, "_category_.json")
         
-        template = self._load_template("_category_conflict.json")
+        # 使用预先绑定的模板渲染函数
+        data = self._render_category_conflict({
+            _LABEL_SENTINEL: label,
+            _ID_SENTINEL: f"{full_path}/category"
+        })
         
-        if template is None:
-            # 使用默认模板
-            template = {
-                "label": label,
-                "position": 1,
-                "link": {
-                    "type": "doc",
-                    "id": f"{full_path}/category"
-                }
-            }
-        else:
-            # 复制模板并替换占位符
-            template = copy.deepcopy(template)
-            # 替换 "label" 字段
-            template["label"] = label
-            # 替换 "id" 字段
-            template["link"]["id"] = f"{full_path}/category"
-
-        # 写入 _category_.json
-        with open(category_file, 'w', encoding='utf-8') as f:
-            json.dump(template, f, indent=4, ensure_ascii=False)
-        
-        # 记录新生成的文件（只记录路径，不记录内容）
+        self._existing_labels.add(label)
+        
+        # 记录本次运行生成的文件，用于去重；写入成功后才计入摘要
+        self._generated_paths.add(category_file)
         rel_path = os.path.relpath(category_file, self.output_dir)
-        self._generated_files.append(rel_path)
         
-        print(f"  ✓ 生成冲突版本 {rel_path}")
+        self._log(f"  ✓ 生成冲突版本 {rel_path}")
         
-        # 生成 category.md（模板3）
-        self._generate_category_category(dir_path, label)
+        return category_file, data
     
-    def _generate_category_category(self, dir_path: str, label: str):
+    def _generate_category_category(self, dir_path: str, label: str) -> Tuple[str, bytes]:
         """
         生成 category 的 category.md 文件（模板3）
+        返回 (文件路径, 文件内容)，由 _write_files 统一写入
         """
         category_file = os.path.join(dir_path, "category.md")
         
@@ -208,31 +365,33 @@ import DocCardList from '@theme/DocCardList';
             # TODO: 后续考虑替换对应字段
             pass
         
-        # 写入文件
-        with open(category_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        # 记录新生成的文件（只记录路径，不记录内容）
+        # 记录本次运行生成的文件，用于去重；写入成功后才计入摘要
+        self._generated_paths.add(category_file)
         rel_path = os.path.relpath(category_file, self.output_dir)
-        self._generated_files.append(rel_path)
         
-        print(f"  ✓ 生成 {rel_path}")
+        self._log(f"  ✓ 生成 {rel_path}")
+        
+        return category_file, content.encode('utf-8')
     
     def _generate_command_md(self, namespace: List[str], command: str,
-                            description: str = "", parameters: List[Dict] = None):
+                            description: str = "", parameters: List[Dict] = None) -> Optional[Tuple[str, bytes]]:
         """
         生成命令的 markdown 文件（模板4）
-        如果文件已存在则跳过
+        返回 (文件路径, 文件内容)，由 _write_files 统一写入；如果文件已存在则跳过并返回 None
         """
         dir_path = os.path.join(self.output_dir, *namespace)
-        os.makedirs(dir_path, exist_ok=True)
+        self._ensure_dir(dir_path)
         
         md_file = os.path.join(dir_path, f"{command}.md")
         
-        # 检查文件是否已存在
-        if self._file_exists(md_file):
-            print(f"  ⊙ 跳过已存在文件: {os.path.relpath(md_file, self.output_dir)}")
-            return
+        # 检查文件是否已存在（包括本次运行已生成、尚未写入的文件）
+        # 新目录中的文件只可能是本次运行生成的，无需访问文件系统
+        exists = md_file in self._generated_paths
+        if not exists and '/'.join(namespace) not in self._new_directories:
+            exists = self._file_exists(md_file)
+        if exists:
+            self._log(f"  ⊙ 跳过已存在文件: {os.path.relpath(md_file, self.output_dir)}")
+            return None
         
         # 构建完整命令字符串
         full_command = ' '.join(namespace) + ' ' + command
@@ -274,60 +433,98 @@ sidebar_position: 1
 """
         else:
             # 替换标题 {和文件名同名的命令，如：get.md 这里就是 get}
-            content = re.sub(r"# \{.*?\}", f"# {command}", content)
+            content = _replace_title(content, command)
             # 替换 {} 占位符为描述
             content = content.replace("{}", desc_text)
         
-        # 写入文件
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        # 记录新生成的文件（只记录路径，不记录内容）
+        # 记录本次运行生成的文件，用于去重；写入成功后才计入摘要
+        self._generated_paths.add(md_file)
         rel_path = os.path.relpath(md_file, self.output_dir)
-        self._generated_files.append(rel_path)
         
-        print(f"  ✓ 生成 {rel_path}")
+        self._log(f"  ✓ 生成 {rel_path}")
+        
+        return md_file, content.encode('utf-8')
     
-    def _get_existing_dirs(self) -> Set[str]:
+    @staticmethod
+    def _write_file(file_path: str, data: bytes):
         """
-        获取输出目录中已存在的所有目录路径
-        返回相对路径的集合（统一使用正斜杠）
+        写入单个文件
+        直接使用 os.open/os.write，省去创建 Python 文件对象的开销
         """
-        existing_dirs = set()
-        if not os.path.exists(self.output_dir):
-            return existing_dirs
-        
-        for root, dirs, files in os.walk(self.output_dir):
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                rel_path = os.path.relpath(dir_path, self.output_dir)
-                # 统一使用正斜杠，确保跨平台一致性
-                existing_dirs.add(rel_path.replace('\\', '/'))
+        fd = os.open(file_path, _WRITE_FLAGS, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def _write_files(self, files: List[Tuple[str, bytes]]):
+        """
+        批量写入生成的文件
+        文件写入是 I/O 密集型操作（会释放 GIL），文件较多时使用线程池并行写入
+        只有写入成功的文件才会计入生成摘要；写入失败时抛出第一个异常
+        """
+        if len(files) < _PARALLEL_WRITE_THRESHOLD:
+            # 与逐个写入时一致：遇到失败即停止，之前写入的文件照常记录
+            for file_path, data in files:
+                self._write_file(file_path, data)
+                self._record_written(file_path, data)
+            return
         
-        return existing_dirs
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            futures = [executor.submit(self._write_file, file_path, data) for file_path, data in files]
+        
+        # 按原有顺序记录写入成功的文件
+        error = None
+        for (file_path, data), future in zip(files, futures):
+            exc = future.exception()
+            if exc is None:
+                self._record_written(file_path, data)
+            elif error is None:
+                error = exc
+        if error is not None:
+            raise error
+    
+    def _record_written(self, file_path: str, data: bytes):
+        """
+        记录写入成功的文件（只记录路径，不记录内容）
+        写入的内容已在内存中，直接累计大小，无需再逐个 stat
+        """
+        self._generated_files.append(os.path.relpath(file_path, self.output_dir))
+        self._generated_total_size += len(data)
     
     def _collect_new_dirs(self, commands: List[Dict]) -> Set[str]:
         """
         收集所有需要生成的新目录路径
+        只检查命令涉及到的目录是否存在，不遍历整个输出目录
         """
-        existing_dirs = self._get_existing_dirs()
-        new_dirs = set()
+        # 输出目录为空（常见于全新生成）时，所有目录都是新目录，无需逐个检查
+        try:
+            with os.scandir(self.output_dir) as it:
+                self._output_dir_empty = next(it, None) is None
+        except FileNotFoundError:
+            self._output_dir_empty = True
         
+        # 先对所有命令的命名空间前缀去重，公共前缀只处理一次
+        prefixes = set()
         for cmd in commands:
-            namespace = cmd.get("namespace", [])
-            if not namespace:
-                continue
-            
-            # 构建路径层次
-            current_path = []
-            for folder in namespace:
-                current_path.append(folder)
-                full_path = '/'.join(current_path)
-                
-                # 只添加新的目录
-                if full_path not in existing_dirs:
-                    new_dirs.add(full_path)
-                existing_dirs.add(full_path)
+            namespace = tuple(cmd.get("namespace", []))
+            for i in range(1, len(namespace) + 1):
+                prefixes.add(namespace[:i])
+        
+        if self._output_dir_empty:
+            return {'/'.join(prefix) for prefix in prefixes}
+        
+        # 排序后父目录总在子目录之前
+        new_prefixes = set()
+        for prefix in sorted(prefixes):
+            # 只添加新的目录；父目录是新目录时，子目录必然不存在，无需再检查
+            if prefix[:-1] in new_prefixes or \
+                    not os.path.isdir(os.path.join(self.output_dir, *prefix)):
+                new_prefixes.add(prefix)
+        
+        new_dirs = {'/'.join(prefix) for prefix in new_prefixes}
         
         return new_dirs
     
@@ -345,26 +542,36 @@ sidebar_position: 1
         
         # 步骤2: 为每个新目录生成 _category_.json
         print("\n步骤 2: 生成目录分类文件...")
+        # 一次性建立已有 label 的索引，供冲突检查使用；输出目录为空时无需扫描
+        if self._output_dir_empty:
+            self._existing_labels = set()
+        else:
+            self._existing_labels = self._scan_existing_labels()
+        # 待写入的文件，所有内容生成完成后统一写入
+        pending_files = []
         for dir_path_str in sorted(new_dirs):
-            dir_path = os.path.join(self.output_dir, dir_path_str)
+            # 与 _generate_command_md 中的路径拼接方式保持一致
+            dir_path = os.path.join(self.output_dir, *dir_path_str.split('/'))
             folder_name = os.path.basename(dir_path_str)
             
             # 确保目录存在
-            os.makedirs(dir_path, exist_ok=True)
+            self._ensure_dir(dir_path)
             
             # 检查 label 冲突
             has_conflict = self._check_label_conflict(folder_name)
             
             if has_conflict:
-                print(f"  检测到 label 冲突: {folder_name}")
+                self._log(f"  检测到 label 冲突: {folder_name}")
                 # 生成冲突版本的 _category_.json 和 category.md
-                self._generate_category_conflict(dir_path, folder_name, dir_path_str)
+                pending_files.append(self._generate_category_conflict(dir_path, folder_name, dir_path_str))
+                pending_files.append(self._generate_category_category(dir_path, folder_name))
             else:
                 # 生成普通的 _category_.json
-                self._generate_category_json(dir_path, folder_name)
+                pending_files.append(self._generate_category_json(dir_path, folder_name))
         
         # 步骤3: 生成命令文件，跳过已存在的
         print("\n步骤 3: 生成命令文档文件...")
+        skipped = 0
         for _, cmd_data in enumerate(commands, 1):
             namespace = cmd_data.get("namespace", [])
             command = cmd_data.get("command", "")
@@ -375,7 +582,17 @@ sidebar_position: 1
                 continue
             
             # 生成命令的 markdown 文件
-            self._generate_command_md(namespace, command, description, parameters)
+            md_item = self._generate_command_md(namespace, command, description, parameters)
+            if md_item is not None:
+                pending_files.append(md_item)
+            else:
+                skipped += 1
+        if skipped:
+            print(f"跳过 {skipped} 个已存在文件")
+        
+        # 步骤4: 统一写入所有生成的文件
+        print("\n步骤 4: 写入文档文件...")
+        self._write_files(pending_files)
     
     def generate_full_structure(self, commands: List[Dict]):
         """
@@ -392,27 +609,31 @@ sidebar_position: 1
     def get_generation_summary(self) -> Dict:
         """
         获取生成摘要
-        返回本次生成过程中创建的文件和目录列表
+        返回本次生成过程中创建的文件和目录列表（文件按生成顺序，目录无序，不做排序）
         """
-        total_size = 0
-        for file_path in self._generated_files:
-            full_path = os.path.join(self.output_dir, file_path)
-            if os.path.exists(full_path):
-                total_size += os.path.getsize(full_path)
-        
         return {
-            "files": sorted(self._generated_files),
-            "directories": sorted(self._new_directories),
+            "files": list(self._generated_files),
+            "directories": list(self._new_directories),
             "total_files": len(self._generated_files),
-            "total_size": total_size
+            "total_size": self._generated_total_size
         }
+    
+    def get_generation_summary_sorted(self) -> Dict:
+        """
+        获取生成摘要，文件和目录列表按路径排序
+        """
+        summary = self.get_generation_summary()
+        summary["files"].sort()
+        summary["directories"].sort()
+        return summary
 
 
 def parse_command_string(command_str: str) -> Dict:
     """
     解析命令字符串为结构化数据
     """
-    parts = command_str.strip().split()
+    # split() 已经会忽略首尾及连续的空白，无需再 strip
+    parts = command_str.split()
     
     # 移除 'acli' 前缀（如果存在）
     if parts and parts[0].lower() == 'acli':
@@ -431,10 +652,7 @@ def parse_command_string(command_str: str) -> Dict:
     namespace = parts[:-1]
     
     # 生成完整命令字符串（移除 acli 前缀后）
-    if command_str.lower().startswith('acli '):
-        full_command = command_str[5:]
-    else:
-        full_command = " ".join(parts)
+    full_command = " ".join(parts)
     
     # 添加描述占位符
     if namespace:
@@ -456,12 +674,7 @@ def parse_command_strings(command_strings: List[str]) -> List[Dict]:
     """
     批量解析命令字符串数组
     """
-    commands = []
-    for cmd_str in command_strings:
-        parsed = parse_command_string(cmd_str)
-        if parsed["command"]:
-            commands.append(parsed)
-    return commands
+    return [parsed for parsed in map(parse_command_string, command_strings) if parsed["command"]]
 
 
 def doc_template_generate(
@@ -498,19 +711,30 @@ def doc_template_generate(
         if not commands_json or commands_json.strip() == "":
             return {"error": "收到的命令参数为空。请检查引号转义。在 Windows CMD 中，使用：python acli_doc_generate.py --commands \"[\\\"acli network nic list\\\"]\""}
         
-        # 解析 JSON
-        raw_data = json.loads(commands_json)
+        command_strings: Optional[List[str]] = None
         
-        # 校验类型：必须是列表
-        if not isinstance(raw_data, list):
-            return {"error": "JSON 格式错误：输入必须是一个数组，例如 '[\"cmd1\", \"cmd2\"]'"}
+        # 安装了 msgspec 时优先使用，解码时已完成类型校验，只需去除首尾空格
+        if _COMMANDS_DECODER is not None:
+            try:
+                command_strings = [cmd.strip() for cmd in _COMMANDS_DECODER.decode(commands_json)]
+            except msgspec.DecodeError:
+                # 格式错误或不是字符串数组，交给下面的标准库逻辑给出一致的错误信息或做类型转换
+                pass
+        
+        if command_strings is None:
+            # 解析 JSON
+            raw_data = json.loads(commands_json)
+            
+            # 校验类型：必须是列表
+            if not isinstance(raw_data, list):
+                return {"error": "JSON 格式错误：输入必须是一个数组，例如 '[\"cmd1\", \"cmd2\"]'"}
+            
+            # 清洗数据：强制转换为字符串并去除首尾空格
+            command_strings = [str(cmd).strip() for cmd in raw_data]
         
-        # 校验内容：列表不能为空，且每个元素最好是字符串
-        if not raw_data:
+        # 校验内容：列表不能为空
+        if not command_strings:
             return {"error": "命令列表不能为空"}
-            
-        # 清洗数据：强制转换为字符串并去除首尾空格
-        command_strings: List[str] = [str(cmd).strip() for cmd in raw_data]
         
         result_lines.append(f"成功解析 {len(command_strings)} 条命令。")
         
@@ -561,7 +785,7 @@ def doc_template_generate(
     
     # 5. 获取生成摘要
     result_lines.append("\n步骤 5: 获取生成摘要...")
-    summary = generator.get_generation_summary()
+    summary = generator.get_generation_summary_sorted()
     result_lines.append(f"生成文件: {summary['total_files']} 个")
     result_lines.append(f"生成目录: {len(summary['directories'])} 个")
     result_lines.append(f"总大小: {summary['total_size']} 字节")
@@ -593,6 +817,7 @@ if __name__ == "__main__":
     '["acli network nic list", "acli system cpu info"]'
   
   注意：如果在命令行中直接传递 JSON，需要正确处理引号转义
+  设置环境变量 ACLI_DOC_VERBOSE=1 可打印每个文件的生成/跳过信息
 
 使用示例：
 **注意，应在项目根目录下执行该python文件，而不是当前目录**